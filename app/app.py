@@ -6,14 +6,47 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import queue
+import threading
+import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
-from PIL import Image
+
+try:
+    import cv2
+except ImportError:  # pragma: no cover - OpenCV is optional for the viewer
+    cv2 = None  # type: ignore
 
 from .camera import SeekCamera, SeekCameraError, SyntheticCamera
-from .display import NullDisplay, Waveshare24Display
+from .display import NullDisplay, Waveshare24Display, rgb888_to_rgb565
+
+# Colormap names and numbers accepted by --colormap
+COLORMAP_NUMBERS = {
+    "0": 0, "grayscale": 0,
+    "1": 1, "autumn": 1,
+    "2": 2, "bone": 2,
+    "3": 3, "jet": 3,
+    "4": 4, "winter": 4,
+    "5": 5, "rainbow": 5,
+    "6": 6, "ocean": 6,
+    "7": 7, "summer": 7,
+    "8": 8, "spring": 8,
+    "9": 9, "cool": 9,
+    "10": 10, "hsv": 10,
+    "11": 11, "pink": 11,
+    "12": 12, "hot": 12,
+    "13": 13, "parula": 13,
+    "14": 14, "magma": 14,
+    "15": 15, "inferno": 15,
+    "16": 16, "plasma": 16,
+    "17": 17, "viridis": 17,
+    "18": 18, "cividis": 18,
+    "19": 19, "twilight": 19,
+    "20": 20, "twilight_shifted": 20,
+    "21": 21, "turbo": 21,
+}
 
 
 @dataclass
@@ -30,11 +63,21 @@ class AppOptions:
     do_ffc: bool = False  # Use flat field calibration
     capture_ffc: bool = False  # Capture new FFC
     ffc_output: Optional[str] = None  # Output path for captured FFC
+    target_fps: float = 30.0  # Frame pacing target for the run loop
+    debug: bool = False  # Print per-frame diagnostics from the run loop
 
 
 class ThermalApp:
     def __init__(self, options: AppOptions) -> None:
         self.options = options
+        # Palette resolved once; colorizing a frame is a single table lookup
+        self._colormap_lut = self._palette_lut(self._resolve_colormap(options.colormap))
+        # Single-slot hand-off from the camera reader thread to run()
+        self._frame_cond = threading.Condition()
+        self._frame_slot: Optional[np.ndarray] = None
+        self._frame_error: Optional[Exception] = None
+        self._reader_stop = threading.Event()
+        self._reader: Optional[threading.Thread] = None
         
         # Initialize camera
         self.camera = self._init_camera()
@@ -44,6 +87,45 @@ class ThermalApp:
         
         print(f"Camera: {self.camera.width}x{self.camera.height}")
         print(f"Display: {type(self.display).__name__}")
+        
+        # Per-frame working buffers, written in place on every iteration
+        frame_shape = (self.camera.height, self.camera.width)
+        lcd_shape = (self.options.lcd_height, self.options.lcd_width)
+        self._raw_buffers = [np.empty(frame_shape, dtype=np.uint16) for _ in range(2)]
+        self._norm_f32 = np.empty(frame_shape, dtype=np.float32)  # NumPy fallback only
+        self._gray8 = np.empty(frame_shape, dtype=np.uint8)
+        self._last_raw: Optional[np.ndarray] = None  # Previous frame, for duplicate detection
+        self._gray_lcd = np.empty(lcd_shape, dtype=np.uint8)
+        # Horizontal flip and 180-degree rotation are applied while
+        # normalizing, so the panel stays on its unrotated fast path. The
+        # NumPy fallback reads the raw frame through this strided view;
+        # OpenCV would copy a negative-stride view, so it flips the 8-bit
+        # result into a preallocated buffer instead (half the bytes).
+        rotate_180 = self.options.display_rotate == 2
+        mirror_x = self.options.display_flip_horizontal != rotate_180
+        self._source_view = (
+            slice(None, None, -1 if rotate_180 else 1),
+            slice(None, None, -1 if mirror_x else 1),
+        )
+        # cv2.flip code for the same orientation, or None when there is none
+        self._flip_code = {(True, True): -1, (True, False): 0, (False, True): 1}.get(
+            (rotate_180, mirror_x)
+        )
+        self._gray8_unflipped = np.empty(frame_shape, dtype=np.uint8) if self._flip_code is not None else None
+        # Source row/column for each LCD pixel, for the OpenCV-less resize
+        self._resize_rows = np.arange(lcd_shape[0]) * frame_shape[0] // lcd_shape[0]
+        self._resize_cols = np.arange(lcd_shape[1]) * frame_shape[1] // lcd_shape[1]
+        
+        # Display writer thread: one pending frame, stale frames are dropped.
+        # Output buffers cycle through a free pool so a frame being shown is
+        # never overwritten (one shown + one queued + one being rendered).
+        # Frames are big-endian RGB565, the panel's native wire format.
+        self._display_queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=1)
+        self._free_frames: "queue.Queue[np.ndarray]" = queue.Queue()
+        for _ in range(3):
+            self._free_frames.put(np.empty(lcd_shape, dtype=">u2"))
+        self._display_error: Optional[Exception] = None
+        self._display_thread: Optional[threading.Thread] = None
 
     def _init_camera(self):
         if self.options.use_synthetic:
@@ -69,7 +151,6 @@ class ThermalApp:
             camera = SeekCamera(camera_type=self.options.camera_type, ffc_path=ffc_path)
             print(f"Camera opened: {camera.width}x{camera.height}")
             # Give camera a moment to stabilize (reduced delay for faster startup)
-            import time
             time.sleep(0.2)
             # Read a few frames to let camera warm up (reduced for faster startup)
             for i in range(3):
@@ -88,7 +169,6 @@ class ThermalApp:
     
     def _capture_ffc(self) -> Optional[str]:
         """Capture a new flat field calibration."""
-        import time
         import os
         from pathlib import Path
         from datetime import datetime
@@ -179,7 +259,9 @@ class ThermalApp:
     def _init_display(self):
         if self.options.lcd == "waveshare":
             try:
-                display = Waveshare24Display(rotate=self.options.display_rotate)
+                # 180 degrees is already applied to the source frame
+                rotate = 0 if self.options.display_rotate == 2 else self.options.display_rotate
+                display = Waveshare24Display(rotate=rotate, debug=self.options.debug)
                 print("Display initialized: Waveshare24Display")
                 return display
             except Exception as e:
@@ -193,11 +275,16 @@ class ThermalApp:
         frame_count = 0
         consecutive_errors = 0
         max_errors = 10
+        frame_period = 1.0 / self.options.target_fps
+        loop = asyncio.get_running_loop()
+        self._start_camera_reader()
+        self._start_display_writer()
+        next_frame_at = time.monotonic() + frame_period
         try:
             while True:
                 try:
-                    # Read raw frame from camera
-                    frame_raw = self.camera.read_raw()
+                    # Wait for the reader thread to deliver the next frame
+                    frame_raw = await loop.run_in_executor(None, self._get_latest_frame)
                     consecutive_errors = 0
                     frame_count += 1
                 except SeekCameraError as e:
@@ -219,53 +306,247 @@ class ThermalApp:
                     await asyncio.sleep(0.5)
                     continue
                 
+                # A repeated sensor frame would render to the same pixels:
+                # skip processing and the SPI transfer entirely
+                if self._last_raw is None:
+                    self._last_raw = frame_raw.copy()
+                elif np.array_equal(frame_raw, self._last_raw):
+                    next_frame_at = await self._wait_for_next_frame(next_frame_at, frame_period)
+                    continue
+                else:
+                    np.copyto(self._last_raw, frame_raw)
+                
                 # Normalize to 0-255 range with better handling
-                frame_min = float(frame_raw.min())
-                frame_max = float(frame_raw.max())
+                frame_min, frame_max = self._min_max(frame_raw)
                 frame_range = frame_max - frame_min
                 
-                # Debug first 5 frames and then every 120 frames (reduced for performance)
-                if frame_count <= 5 or frame_count % 120 == 0:
+                # Debug first 5 frames and then every 120 frames (only with --debug)
+                if self.options.debug and (frame_count <= 5 or frame_count % 120 == 0):
                     print(f"Frame {frame_count}: raw min={frame_min:.0f}, max={frame_max:.0f}, range={frame_range:.0f}, shape={frame_raw.shape}", flush=True)
                 
-                # Normalize frame - optimized for speed
+                # Normalize as saturate(raw * alpha + beta), reading the
+                # source through the flip/rotate view
                 if frame_range > 10:  # Need at least 10 units of range
-                    # Normalize to 0-255 (optimized calculation)
-                    frame_normalized = ((frame_raw.astype(np.float32) - frame_min) / frame_range * 255.0).astype(np.uint8)
+                    alpha = 255.0 / frame_range
+                    beta = -frame_min * alpha
                 elif frame_range > 0:
                     # Very small range - stretch it more aggressively
                     padding = max(100.0, frame_range * 2)
                     frame_center = (frame_min + frame_max) * 0.5
                     frame_min_adj = frame_center - padding
                     frame_range_adj = padding * 2.0
-                    frame_normalized = np.clip(((frame_raw.astype(np.float32) - frame_min_adj) / frame_range_adj * 255.0), 0, 255).astype(np.uint8)
+                    alpha = 255.0 / frame_range_adj
+                    beta = -frame_min_adj * alpha
                 else:
                     # All pixels same value - show as mid-gray
-                    frame_normalized = np.full_like(frame_raw, 128, dtype=np.uint8)
-                
-                # Apply color palette
-                frame_rgb = self._apply_colormap(frame_normalized)
-                
-                # Create PIL image from numpy array
-                image = Image.fromarray(frame_rgb, mode='RGB')
+                    alpha, beta = 0.0, 128.0
+                frame_normalized = self._normalize_to_gray(frame_raw, alpha, beta)
                 
-                # Resize to display size (using faster resize method)
-                image = image.resize((self.options.lcd_width, self.options.lcd_height), Image.NEAREST)  # NEAREST is faster than BILINEAR
+                # Resize the 8-bit frame, then colorize straight into a
+                # pooled RGB565 buffer at display size
+                frame_lcd = self._resize_for_display(frame_normalized, out=self._gray_lcd)
+                buffer = self._free_frames.get()
+                frame_out = self._apply_colormap(frame_lcd, out=buffer)
                 
-                # Apply flip if needed
-                if self.options.display_flip_horizontal:
-                    image = image.transpose(Image.FLIP_LEFT_RIGHT)
+                # Hand off to the display thread; SPI transfer overlaps the next frame
+                self._submit_frame(frame_out)
+                if self._display_error is not None:
+                    raise self._display_error
                 
-                # Display
-                self.display.show(image)
-                
-                # Minimal delay for frame rate control (optimized for higher FPS)
-                await asyncio.sleep(0.03)  # ~30 FPS target
+                next_frame_at = await self._wait_for_next_frame(next_frame_at, frame_period)
         finally:
             self.shutdown()
 
-    def _apply_colormap(self, gray_frame: np.ndarray) -> np.ndarray:
-        """Apply color palette to grayscale thermal image.
+    async def _wait_for_next_frame(self, deadline: float, frame_period: float) -> float:
+        """Sleep until ``deadline`` and return the deadline after it.
+
+        Deadlines advance by a fixed period, so the cadence does not drift
+        with per-frame jitter. After falling more than a period behind (e.g.
+        an error back-off) the schedule restarts from now instead of
+        rendering a burst of frames to catch up.
+        """
+        now = time.monotonic()
+        delay = deadline - now
+        if delay < -frame_period:
+            deadline = now
+        await asyncio.sleep(delay if delay > 0 else 0)
+        return deadline + frame_period
+
+    def _min_max(self, frame_raw: np.ndarray) -> Tuple[float, float]:
+        """Return the frame's (min, max) from one SIMD pass when OpenCV is available."""
+        if cv2 is not None:
+            frame_min, frame_max, _, _ = cv2.minMaxLoc(frame_raw)
+            return frame_min, frame_max
+        return float(frame_raw.min()), float(frame_raw.max())
+
+    def _normalize_to_gray(self, frame_raw: np.ndarray, alpha: float, beta: float) -> np.ndarray:
+        """Map raw counts to ``saturate(raw * alpha + beta)`` in the 8-bit buffer.
+
+        OpenCV does the scale, offset, clamp and uint16->uint8 cast in one
+        SIMD pass; the NumPy fallback needs a float32 scratch buffer. Callers
+        pick ``beta`` so the result is never negative (convertScaleAbs takes
+        the absolute value). The configured flip/rotation is applied here.
+        """
+        if cv2 is not None:
+            if self._flip_code is None:
+                return cv2.convertScaleAbs(frame_raw, dst=self._gray8, alpha=alpha, beta=beta)
+            gray = cv2.convertScaleAbs(frame_raw, dst=self._gray8_unflipped, alpha=alpha, beta=beta)
+            return cv2.flip(gray, self._flip_code, dst=self._gray8)
+        scratch = self._norm_f32
+        np.multiply(frame_raw[self._source_view], alpha, out=scratch, dtype=np.float32)
+        scratch += beta
+        np.clip(scratch, 0, 255, out=scratch)
+        np.rint(scratch, out=scratch)  # round like OpenCV's saturate_cast
+        np.copyto(self._gray8, scratch, casting="unsafe")
+        return self._gray8
+
+    def _start_camera_reader(self) -> None:
+        self._reader_stop.clear()
+        self._reader = threading.Thread(target=self._camera_reader, name="camera-reader", daemon=True)
+        self._reader.start()
+
+    def _camera_reader(self) -> None:
+        """Read frames on a background thread so USB transfers overlap processing.
+
+        The slot holds at most one frame; the reader waits for run() to take it
+        before reading the next one. Read errors are handed over through the
+        same slot so run() keeps its retry/shutdown handling.
+        """
+        index = 0
+        while not self._reader_stop.is_set():
+            try:
+                # read_raw() returns a view of the camera buffer, so copy it
+                # out; two buffers alternate since run() holds one at a time
+                frame = self._raw_buffers[index]
+                np.copyto(frame, self.camera.read_raw())
+                index ^= 1
+                error = None
+            except Exception as e:
+                frame, error = None, e
+            with self._frame_cond:
+                self._frame_slot = frame
+                self._frame_error = error
+                self._frame_cond.notify_all()
+                while self._frame_slot is not None or self._frame_error is not None:
+                    if self._reader_stop.is_set():
+                        return
+                    self._frame_cond.wait(timeout=0.5)
+
+    def _get_latest_frame(self) -> np.ndarray:
+        with self._frame_cond:
+            while self._frame_slot is None and self._frame_error is None:
+                if self._reader_stop.is_set():
+                    raise SeekCameraError("Camera reader stopped")
+                self._frame_cond.wait(timeout=0.5)
+            frame, error = self._frame_slot, self._frame_error
+            self._frame_slot = None
+            self._frame_error = None
+            self._frame_cond.notify_all()
+        if error is not None:
+            raise error
+        return frame
+
+    def _stop_camera_reader(self) -> bool:
+        """Ask the reader to stop; True once it has exited.
+
+        A reader still blocked in a native read is kept, since the camera
+        must not be closed under it.
+        """
+        self._reader_stop.set()
+        with self._frame_cond:
+            self._frame_cond.notify_all()
+        if self._reader is not None:
+            self._reader.join(timeout=1.0)
+            if self._reader.is_alive():
+                return False
+            self._reader = None
+        return True
+
+    def _start_display_writer(self) -> None:
+        self._display_error = None
+        self._display_thread = threading.Thread(target=self._display_writer, name="display-writer", daemon=True)
+        self._display_thread.start()
+
+    def _display_writer(self) -> None:
+        while True:
+            frame = self._display_queue.get()
+            if frame is None:
+                return
+            try:
+                self.display.show_array(frame)
+            except Exception as e:
+                # Surface the failure in run(), which owns shutdown
+                self._display_error = e
+            finally:
+                self._free_frames.put(frame)
+
+    def _submit_frame(self, frame: np.ndarray) -> None:
+        """Queue a pooled frame for the display thread, replacing any frame still pending."""
+        self._replace_pending(frame)
+
+    def _replace_pending(self, item: Optional[np.ndarray]) -> None:
+        try:
+            self._display_queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        try:
+            stale = self._display_queue.get_nowait()
+        except queue.Empty:
+            stale = None
+        if stale is not None:
+            self._free_frames.put(stale)
+        # Only run() puts into the queue, so there is room now
+        self._display_queue.put_nowait(item)
+
+    def _stop_display_writer(self) -> bool:
+        """Ask the writer to stop; True once it has exited.
+
+        A writer still inside a slow SPI transfer is kept, since the display
+        must not be torn down under it.
+        """
+        if self._display_thread is None:
+            return True
+        self._replace_pending(None)
+        self._display_thread.join(timeout=1.0)
+        if self._display_thread.is_alive():
+            return False
+        self._display_thread = None
+        return True
+
+    def _resize_for_display(self, frame_gray: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Scale an 8-bit frame to the LCD size, into ``out`` when given.
+
+        Resizing before colorizing interpolates one byte per pixel instead
+        of three, and never blends packed RGB565 values. Without OpenCV it
+        falls back to a nearest-neighbour NumPy gather.
+        """
+        if cv2 is None:
+            # Nearest-neighbour gather through the precomputed source indices
+            resized = frame_gray[self._resize_rows[:, None], self._resize_cols[None, :]]
+            if out is None:
+                return resized
+            np.copyto(out, resized)
+            return out
+        size = (self.options.lcd_width, self.options.lcd_height)
+        return cv2.resize(frame_gray, size, dst=out, interpolation=cv2.INTER_LINEAR)
+
+    def _apply_colormap(self, gray_frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply the resolved color palette to a grayscale frame, producing RGB565.
+
+        cv2.LUT splits the gather across cores. It only knows native-endian
+        uint16, so the big-endian table and output are passed as byte-identical
+        native views; the bytes written are exactly the wire format.
+        """
+        if cv2 is None:
+            return np.take(self._colormap_lut, gray_frame, out=out)
+        if out is None:
+            out = np.empty(gray_frame.shape, dtype=self._colormap_lut.dtype)
+        cv2.LUT(gray_frame, self._colormap_lut.view(np.uint16), dst=out.view(np.uint16))
+        return out
+
+    def _resolve_colormap(self, colormap: str) -> int:
+        """Map a colormap name or number to an OpenCV colormap number.
         
         Uses standard OpenCV colormap numbers:
         0=grayscale, 1=autumn, 2=bone, 3=jet, 4=winter, 5=rainbow, 6=ocean,
@@ -273,67 +554,59 @@ class ThermalApp:
         14=magma, 15=inferno, 16=plasma, 17=viridis, 18=cividis, 19=twilight,
         20=twilight_shifted, 21=turbo
         """
-        colormap = self.options.colormap.lower()
-        
-        if colormap == "grayscale" or colormap == "0":
-            # Simple grayscale - stack 3 channels
-            return np.stack([gray_frame, gray_frame, gray_frame], axis=-1)
-        
-        # Use OpenCV colormaps if available
-        try:
-            import cv2
-            # Map names to standard cv2 colormap numbers
-            colormap_map = {
-                "0": 0, "grayscale": 0,
-                "1": 1, "autumn": 1,
-                "2": 2, "bone": 2,
-                "3": 3, "jet": 3,
-                "4": 4, "winter": 4,
-                "5": 5, "rainbow": 5,
-                "6": 6, "ocean": 6,
-                "7": 7, "summer": 7,
-                "8": 8, "spring": 8,
-                "9": 9, "cool": 9,
-                "10": 10, "hsv": 10,
-                "11": 11, "pink": 11,
-                "12": 12, "hot": 12,
-                "13": 13, "parula": 13,
-                "14": 14, "magma": 14,
-                "15": 15, "inferno": 15,
-                "16": 16, "plasma": 16,
-                "17": 17, "viridis": 17,
-                "18": 18, "cividis": 18,
-                "19": 19, "twilight": 19,
-                "20": 20, "twilight_shifted": 20,
-                "21": 21, "turbo": 21,
-            }
-            
-            if colormap in colormap_map:
-                cmap_num = colormap_map[colormap]
-                if cmap_num == 0:
-                    # Grayscale
-                    return np.stack([gray_frame, gray_frame, gray_frame], axis=-1)
-                # OpenCV colormaps expect uint8 grayscale input
-                colored = cv2.applyColorMap(gray_frame, cmap_num)
-                # Convert BGR to RGB (OpenCV uses BGR)
-                return cv2.cvtColor(colored, cv2.COLOR_BGR2RGB)
-        except ImportError:
-            pass
-        
-        # Fallback: simple grayscale if OpenCV not available or unknown colormap
-        if colormap != "grayscale" and colormap != "0":
+        colormap = colormap.lower()
+        cmap_num = COLORMAP_NUMBERS.get(colormap)
+        if cmap_num is None or (cmap_num != 0 and cv2 is None):
+            # Fallback: simple grayscale if OpenCV not available or unknown colormap
             print(f"Warning: Colormap '{colormap}' not available, using grayscale")
-        return np.stack([gray_frame, gray_frame, gray_frame], axis=-1)
+            return 0
+        return cmap_num
+
+    def _palette_lut(self, cmap_num: int) -> np.ndarray:
+        """Build the 256-entry RGB565 lookup table for a colormap.
+
+        The table is built once by colorizing a 0-255 ramp, so per-frame
+        colorization is one cv2.LUT pass (np.take without OpenCV) instead of
+        applyColorMap followed by a BGR->RGB conversion. Colormap 0 is
+        grayscale.
+        """
+        ramp = np.arange(256, dtype=np.uint8).reshape(256, 1)
+        if cmap_num == 0:
+            rgb = np.repeat(ramp, 3, axis=1)
+        else:
+            colored = cv2.applyColorMap(ramp, cmap_num)
+            rgb = cv2.cvtColor(colored, cv2.COLOR_BGR2RGB).reshape(256, 3)
+        return rgb888_to_rgb565(rgb)
 
     def shutdown(self) -> None:
-        try:
-            self.camera.close()
-        except Exception:
-            pass
-        try:
-            self.display.cleanup()
-        except Exception:
-            pass
+        reader_stopped = self._stop_camera_reader()
+        writer_stopped = self._stop_display_writer()
+        if reader_stopped:
+            try:
+                self.camera.close()
+            except Exception:
+                pass
+        else:
+            # Freeing the shim handle mid-read would let C write into freed memory
+            print("Warning: camera reader still busy, leaving the camera open")
+        if writer_stopped:
+            try:
+                self.display.cleanup()
+            except Exception:
+                pass
+        else:
+            print("Warning: display writer still busy, leaving the display open")
+
+
+def _positive_float(value: str) -> float:
+    """argparse type for rates that must be above zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
 
 
 def parse_args() -> argparse.Namespace:
@@ -444,6 +717,19 @@ Available colormaps (use number or name):
         help="LCD display type (default: waveshare)"
     )
     
+    parser.add_argument(
+        "--fps",
+        type=_positive_float,
+        default=30.0,
+        help="Target display frame rate (default: 30)"
+    )
+    
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Print per-frame diagnostics (frame statistics every 120 frames)"
+    )
+    
     return parser.parse_args()
 
 
@@ -468,7 +754,10 @@ async def main() -> None:
         do_ffc=args.ffc or args.ffc_path is not None,
         capture_ffc=args.ffc_capture,
         ffc_output=args.ffc_output,
+        target_fps=args.fps,
+        debug=args.debug,
     )
+    assert options.target_fps > 0, "target_fps must be positive"
     
     print(f"Options: camera={options.camera_type}, colormap={options.colormap}, "
           f"ffc={options.do_ffc}, flip={options.display_flip_horizontal}, rotate={args.rotate}°", flush=True)
@@ -487,4 +776,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop has noticeably lower per-iteration overhead on the Pi
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -5,6 +5,7 @@ Camera interface that bridges libseek to Python via the seekshim wrapper.
 from __future__ import annotations
 
 import ctypes
+import functools
 import os
 import pathlib
 from typing import Optional
@@ -50,6 +51,52 @@ def autodetect_camera_type(shim_path: Optional[str] = None, default: str = "seek
     return default
 
 
+@functools.lru_cache(maxsize=None)
+def _load_shim(shim_path: Optional[str], env_path: Optional[str]) -> ctypes.CDLL:
+    """
+    Locate, open and prototype libseekshim once per process and path.
+
+    Repeat camera opens (autodetection, FFC capture, reopening) reuse the
+    configured library instead of walking the search path again. The caller
+    passes in SEEK_SHIM_PATH so a changed variable is a new cache key.
+    """
+    candidates = []
+    if shim_path:
+        candidates.append(pathlib.Path(shim_path))
+    if env_path:
+        candidates.append(pathlib.Path(env_path))
+
+    cwd_candidates = [
+        pathlib.Path(__file__).resolve().parent.parent / "native" / "build" / "libseekshim.so",
+        pathlib.Path(__file__).resolve().parent.parent / "native" / "libseekshim.so",
+    ]
+
+    for candidate in candidates + cwd_candidates:
+        if candidate and candidate.exists():
+            lib = ctypes.CDLL(str(candidate))
+            break
+    else:
+        lib = ctypes.CDLL("libseekshim.so")
+
+    lib.seek_open.restype = ctypes.c_void_p
+    lib.seek_open.argtypes = (ctypes.c_int, ctypes.c_char_p)
+    lib.seek_close.restype = None
+    lib.seek_close.argtypes = (ctypes.c_void_p,)
+    lib.seek_get_dimensions.restype = ctypes.c_int
+    lib.seek_get_dimensions.argtypes = (
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+    )
+    lib.seek_read_frame.restype = ctypes.c_int
+    lib.seek_read_frame.argtypes = (
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_uint16),
+        ctypes.c_int,
+    )
+    return lib
+
+
 class SeekCamera:
     """
     Thin wrapper around the native `seekshim` shared library.
@@ -83,7 +130,7 @@ class SeekCamera:
         if self._camera_type not in self._CAMERA_TYPES:
             raise ValueError(f"Unsupported camera type: {camera_type!r}")
 
-        self._shim = self._load_shim(shim_path)
+        self._shim = _load_shim(shim_path, os.environ.get("SEEK_SHIM_PATH"))
         self._handle = self._shim.seek_open(
             self._CAMERA_TYPES[self._camera_type],
             ffc_path.encode("utf-8") if ffc_path else None,
@@ -101,44 +148,9 @@ class SeekCamera:
         self.width = int(width.value)
         self.height = int(height.value)
         self._buffer = np.empty((self.height, self.width), dtype=np.uint16)
-
-    def _load_shim(self, shim_path: Optional[str]) -> ctypes.CDLL:
-        candidates = []
-        if shim_path:
-            candidates.append(pathlib.Path(shim_path))
-        env_path = os.environ.get("SEEK_SHIM_PATH")
-        if env_path:
-            candidates.append(pathlib.Path(env_path))
-
-        cwd_candidates = [
-            pathlib.Path(__file__).resolve().parent.parent / "native" / "build" / "libseekshim.so",
-            pathlib.Path(__file__).resolve().parent.parent / "native" / "libseekshim.so",
-        ]
-
-        for candidate in candidates + cwd_candidates:
-            if candidate and candidate.exists():
-                lib = ctypes.CDLL(str(candidate))
-                break
-        else:
-            lib = ctypes.CDLL("libseekshim.so")
-
-        lib.seek_open.restype = ctypes.c_void_p
-        lib.seek_open.argtypes = (ctypes.c_int, ctypes.c_char_p)
-        lib.seek_close.restype = None
-        lib.seek_close.argtypes = (ctypes.c_void_p,)
-        lib.seek_get_dimensions.restype = ctypes.c_int
-        lib.seek_get_dimensions.argtypes = (
-            ctypes.c_void_p,
-            ctypes.POINTER(ctypes.c_int),
-            ctypes.POINTER(ctypes.c_int),
-        )
-        lib.seek_read_frame.restype = ctypes.c_int
-        lib.seek_read_frame.argtypes = (
-            ctypes.c_void_p,
-            ctypes.POINTER(ctypes.c_uint16),
-            ctypes.c_int,
-        )
-        return lib
+        # The buffer never moves, so its C pointer is built once, not per read
+        self._buffer_ptr = self._buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_uint16))
+        self._buffer_size = self._buffer.size
 
     def read_raw(self) -> np.ndarray:
         """
@@ -149,14 +161,10 @@ class SeekCamera:
         numpy.ndarray
             A view backed by the internal buffer of shape (H, W) and dtype uint16.
         """
-        count = self._shim.seek_read_frame(
-            self._handle,
-            self._buffer.ctypes.data_as(ctypes.POINTER(ctypes.c_uint16)),
-            self._buffer.size,
-        )
+        count = self._shim.seek_read_frame(self._handle, self._buffer_ptr, self._buffer_size)
         if count < 0:
             raise SeekCameraError(f"seek_read_frame failed with code {count}")
-        return self._buffer.reshape(self.height, self.width)
+        return self._buffer
 
     def close(self) -> None:
         """Release the camera handle."""
@@ -183,26 +191,35 @@ class SeekCamera:
 class SyntheticCamera(SeekCamera):
     """
     Dummy implementation that generates gradient frames for development without hardware.
+
+    One full rotation of the gradient is rendered up front and replayed, so
+    reading a frame costs nothing and profiling measures the pipeline only.
     """
 
+    RING_SIZE = 64
+
     def __init__(self, width: int = 206, height: int = 156) -> None:
         self.width = width
         self.height = height
         self._shim = None
         self._handle = None
-        self._buffer = np.zeros((self.height, self.width), dtype=np.uint16)
-        self._phase = 0
-
-    def read_raw(self) -> np.ndarray:
         xv, yv = np.meshgrid(
             np.linspace(0, 65535, self.width, dtype=np.float32),
             np.linspace(0, 65535, self.height, dtype=np.float32),
         )
-        frame = (xv * np.sin(self._phase) + yv * np.cos(self._phase)).astype(np.uint16)
-        self._buffer[:, :] = frame
-        self._phase += 0.1
-        return self._buffer
+        self._frames = []
+        for i in range(self.RING_SIZE):
+            phase = 2.0 * np.pi * i / self.RING_SIZE
+            frame = (xv * np.sin(phase) + yv * np.cos(phase)).astype(np.uint16)
+            frame.flags.writeable = False
+            self._frames.append(frame)
+        self._index = 0
+
+    def read_raw(self) -> np.ndarray:
+        frame = self._frames[self._index]
+        self._index = (self._index + 1) % self.RING_SIZE
+        return frame
 
     def close(self) -> None:
-        self._buffer.fill(0)
+        self._index = 0
 
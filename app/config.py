@@ -6,7 +6,10 @@ from __future__ import annotations
 
 import dataclasses
 import json
+import os
 import pathlib
+import stat
+import tempfile
 from typing import Optional
 
 
@@ -27,6 +30,22 @@ class ConfigData:
     default_threshold_f: float = 86.0
 
 
+def _read_umask() -> int:
+    # Reading the umask means setting it; done once at import, before the
+    # app starts any threads that could create files in between
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode a plain open() would give a new config.json
+_NEW_FILE_MODE = 0o666 & ~_read_umask()
+
+# Field defaults, built once; every value is immutable so a shallow copy
+# per load is enough
+_DEFAULTS = dataclasses.asdict(ConfigData())
+
+
 def load_config() -> ConfigData:
     if not CONFIG_PATH.exists():
         return ConfigData()
@@ -37,13 +56,36 @@ def load_config() -> ConfigData:
     except (OSError, json.JSONDecodeError):
         return ConfigData()
 
-    defaults = dataclasses.asdict(ConfigData())
+    defaults = dict(_DEFAULTS)
     defaults.update(payload)
     return ConfigData(**defaults)
 
 
 def save_config(config: ConfigData) -> None:
+    """
+    Write the config atomically: a temp file in the same directory is
+    renamed over the old one, so a crash mid-write never leaves a truncated
+    config.json behind.
+    """
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with CONFIG_PATH.open("w", encoding="utf-8") as fp:
-        json.dump(dataclasses.asdict(config), fp, indent=2)
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_DIR, prefix=".config-", suffix=".tmp")
+    try:
+        # mkstemp creates the file 0600; keep the mode a plain write would give
+        os.fchmod(fd, _config_file_mode())
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            json.dump(dataclasses.asdict(config), fp, indent=2)
+        os.replace(tmp_path, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
+
+def _config_file_mode() -> int:
+    """Mode of the existing config.json, or the umask default for a new one."""
+    try:
+        return stat.S_IMODE(os.stat(CONFIG_PATH).st_mode)
+    except FileNotFoundError:
+        return _NEW_FILE_MODE
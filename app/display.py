@@ -9,6 +9,7 @@ from typing import Optional
 import sys
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
 # Try to import Waveshare's official driver
@@ -38,6 +39,37 @@ class DisplayError(RuntimeError):
     pass
 
 
+def rgb888_to_rgb565(frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Pack an (..., 3) uint8 RGB array into big-endian RGB565, the byte order
+    the ST7789 expects on the wire.
+    """
+    if out is None:
+        out = np.empty(frame.shape[:-1], dtype=">u2")
+    r = frame[..., 0].astype(np.uint16)
+    g = frame[..., 1].astype(np.uint16)
+    b = frame[..., 2].astype(np.uint16)
+    r &= 0xF8
+    r <<= 8
+    g &= 0xFC
+    g <<= 3
+    b >>= 3
+    r |= g
+    r |= b
+    out[...] = r
+    return out
+
+
+def rgb565_to_rgb888(frame: np.ndarray) -> np.ndarray:
+    """Expand an (H, W) RGB565 frame back to (H, W, 3) uint8 RGB."""
+    packed = frame.astype(np.uint16)
+    rgb = np.empty(frame.shape + (3,), dtype=np.uint8)
+    rgb[..., 0] = (packed >> 8) & 0xF8
+    rgb[..., 1] = (packed >> 3) & 0xFC
+    rgb[..., 2] = (packed << 3) & 0xF8
+    return rgb
+
+
 class NullDisplay:
     """
     No-op display useful during development on non-Pi machines.
@@ -54,6 +86,12 @@ class NullDisplay:
         if self._frame_count % 30 == 0:
             print(f"NullDisplay: Frame {self._frame_count} (no actual display output)")
 
+    def show_array(self, frame: np.ndarray) -> None:
+        """Accept an RGB565 or RGB frame like the SPI fast path does."""
+        if frame.ndim == 2:
+            frame = rgb565_to_rgb888(frame)
+        self.show(Image.fromarray(frame))
+
     def cleanup(self) -> None:
         self.last_frame = None
 
@@ -74,12 +112,21 @@ class Waveshare24Display:
         width: int = 240,
         height: int = 320,
         rotate: int = 0,
+        spi_speed_hz: int = 62_500_000,  # 250 MHz core clock / 4, within ST7789 write timing
+        debug: bool = False,  # Print periodic frame diagnostics from show()
     ) -> None:
         self.width = width
         self.height = height
         self.rotate = rotate
+        self._debug = debug
+        self._frame_count = 0
         self._use_waveshare = False
         self._backlight = None
+        # Panel state for the show_array fast path: the address window last
+        # programmed and the pixels last sent. ShowImage rewrites both, so
+        # show() resets them.
+        self._window: Optional[tuple] = None
+        self._last_sent: Optional[np.ndarray] = None
         
         # Prefer Waveshare's official driver if available
         if WAVESHARE_AVAILABLE and LCD_2inch4 is not None:
@@ -87,6 +134,11 @@ class Waveshare24Display:
                 print("Using Waveshare official driver...")
                 self._device = LCD_2inch4.LCD_2inch4()
                 self._device.Init()
+                # The driver opens the bus at its own default clock
+                self._device.SPI.max_speed_hz = spi_speed_hz
+                # The driver names the DC pin differently across releases
+                dc_pin = getattr(self._device, "GPIO_DC_PIN", None)
+                self._dc_pin = dc_pin if dc_pin is not None else self._device.DC_PIN
                 self._use_waveshare = True
                 print(f"Waveshare display initialized: {width}x{height}")
                 return
@@ -117,7 +169,7 @@ class Waveshare24Display:
                 device=spi_device,
                 gpio_DC=gpio_dc,
                 gpio_RST=gpio_rst,
-                bus_speed_hz=50_000_000,
+                bus_speed_hz=spi_speed_hz,
             )
             self._device = st7789(serial_interface=serial, width=width, height=height, rotate=rotate)
             print(f"luma.lcd ST7789 device created: {width}x{height}, rotate={rotate}")
@@ -128,10 +180,12 @@ class Waveshare24Display:
         # Enable backlight (GPIO 18 = Pin 12 for Waveshare 2.4")
         if gpio_bl is not None:
             try:
-                from gpiozero import PWMLED  # type: ignore
+                from gpiozero import DigitalOutputDevice  # type: ignore
                 try:
-                    self._backlight = PWMLED(gpio_bl)
-                    self._backlight.value = 1.0
+                    # Always full brightness, so a plain output instead of a
+                    # software PWM thread toggling the pin in the background
+                    self._backlight = DigitalOutputDevice(gpio_bl)
+                    self._backlight.on()
                     print(f"Backlight enabled on GPIO {gpio_bl}")
                 except Exception as e:
                     print(f"Warning: Could not enable backlight: {e}")
@@ -150,36 +204,30 @@ class Waveshare24Display:
 
     def show(self, image: Image.Image) -> None:
         try:
-            # Convert to RGB and ensure proper format
-            if image.mode != "RGB":
-                rgb_image = image.convert("RGB")
-            else:
-                rgb_image = image.copy()
+            # Convert to RGB only when needed; the drivers never modify the image
+            rgb_image = image if image.mode == "RGB" else image.convert("RGB")
             
-            # Ensure image is the right size for display
+            # Ensure image is the right size for display (nearest is plenty on a 2.4" panel)
             if rgb_image.size != (self.width, self.height):
-                rgb_image = rgb_image.resize((self.width, self.height), Image.BILINEAR)
+                rgb_image = rgb_image.resize((self.width, self.height), Image.NEAREST)
             
             # Apply rotation if needed
             if self.rotate != 0:
                 rgb_image = rgb_image.rotate(-self.rotate * 90, expand=False)
             
-            # Debug: Check image data before sending
-            if hasattr(self, '_frame_count'):
+            # Debug: Check image data before sending (only with --debug, first frame and every 120 frames)
+            if self._debug:
                 self._frame_count += 1
-            else:
-                self._frame_count = 1
-            
-            # Reduced debug output for performance (only first frame and every 120 frames)
-            if self._frame_count <= 1 or self._frame_count % 120 == 0:
-                import numpy as np
-                img_array = np.array(rgb_image)
-                print(f"Display.show() frame {self._frame_count}: size={rgb_image.size}, mode={rgb_image.mode}, "
-                      f"min={img_array.min()}, max={img_array.max()}, mean={img_array.mean():.1f}")
+                if self._frame_count <= 1 or self._frame_count % 120 == 0:
+                    # Per-channel (min, max) straight from PIL, without an ndarray copy
+                    print(f"Display.show() frame {self._frame_count}: size={rgb_image.size}, mode={rgb_image.mode}, "
+                          f"extrema={rgb_image.getextrema()}")
             
             # Display using Waveshare driver or luma.lcd
             if self._use_waveshare:
                 # Waveshare's ShowImage method
+                self._window = None
+                self._last_sent = None
                 self._device.ShowImage(rgb_image)
             else:
                 # luma.lcd display method
@@ -191,6 +239,67 @@ class Waveshare24Display:
             traceback.print_exc()
             raise
 
+    def show_array(self, frame: np.ndarray) -> None:
+        """
+        Push a frame straight to the panel.
+
+        Takes an (H, W) RGB565 frame, which is sent as-is, or an (H, W, 3)
+        uint8 RGB frame, which is packed to RGB565 in NumPy first. Only the
+        region that changed since the last frame is sent, in one SPI call,
+        skipping the PIL image and the per-pixel list conversion done by
+        ``ShowImage``. Rotated output and the luma.lcd fallback go through
+        ``show``.
+        """
+        height, width = frame.shape[:2]
+        if not self._use_waveshare or self.rotate != 0 or (width, height) != (self.width, self.height):
+            if frame.ndim == 2:
+                frame = rgb565_to_rgb888(frame)
+            self.show(Image.fromarray(frame))
+            return
+
+        if frame.ndim == 2:
+            packed = frame.astype(">u2", copy=False)
+        else:
+            packed = rgb888_to_rgb565(frame)
+
+        # The panel keeps what it was sent: only the bounding box of pixels
+        # that changed since the last frame goes over the bus
+        window = (0, 0, self.width, self.height)
+        if self._last_sent is None:
+            self._last_sent = packed.copy()
+        else:
+            changed = packed != self._last_sent
+            rows = np.flatnonzero(changed.any(axis=1))
+            if rows.size == 0:
+                return
+            cols = np.flatnonzero(changed.any(axis=0))
+            window = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+            np.copyto(self._last_sent, packed)
+        x0, y0, x1, y1 = window
+        self._write_window(np.ascontiguousarray(packed[y0:y1, x0:x1]), window)
+
+    def _write_window(self, pixels: np.ndarray, window: tuple) -> None:
+        """Write packed RGB565 pixels into the (x0, y0, x1, y1) address window."""
+        device = self._device
+        if self._window is None:
+            device.command(0x36)  # MADCTL: portrait, RGB order (matches ShowImage)
+            device.data(0x00)
+        if window != self._window:
+            device.SetWindows(*window)  # ends with RAMWR
+            self._window = window
+        else:
+            # Same window as last time: RAMWR restarts at its origin
+            device.command(0x2C)
+        device.digital_write(self._dc_pin, True)
+        spi = device.SPI
+        if hasattr(spi, "writebytes2"):
+            # spidev chunks large buffers internally, no Python-level loop
+            spi.writebytes2(pixels)
+        else:
+            raw = pixels.tobytes()
+            for i in range(0, len(raw), 4096):
+                spi.writebytes(list(raw[i:i + 4096]))
+
     def cleanup(self) -> None:
         try:
             if self._use_waveshare:
@@ -201,6 +310,7 @@ class Waveshare24Display:
             pass
         if getattr(self, "_backlight", None):
             try:
+                self._backlight.off()
                 self._backlight.close()
             except Exception:
                 pass
@@ -13,19 +13,21 @@ from .processing import (
     COLORMAPS,
     TemperatureModel,
     compute_hotspots,
-    highlight_threshold,
+    compute_hotspots_raw,
+    highlight_threshold_raw,
+    histogram_percentiles,
 )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ModeHooks:
     save_ffc: Callable[[np.ndarray], Optional[str]]
     reload_camera: Callable[[Optional[str]], None]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ModeResult:
-    status: List[str]
+    status: Sequence[str]
     highlight_mask: Optional[np.ndarray] = None
     banner: Optional[str] = None
     stats: Optional[dict] = None
@@ -34,6 +36,9 @@ class ModeResult:
 
 class Mode:
     name = "Mode"
+    # Modes that never read frame_celsius set this to False so the manager
+    # can skip the full-frame temperature conversion.
+    uses_celsius_frame = True
 
     def on_enter(self, state: "ModeState") -> ModeResult | None:
         return None  # pragma: no cover - default no-op
@@ -44,7 +49,7 @@ class Mode:
     def update(
         self,
         frame_raw: np.ndarray,
-        frame_celsius: np.ndarray,
+        frame_celsius: Optional[np.ndarray],
         state: "ModeState",
         temperature_model: TemperatureModel,
     ) -> ModeResult:
@@ -62,23 +67,38 @@ class Mode:
 
 class LiveHighlightMode(Mode):
     name = "Live"
+    # Stats and mask both come straight from the raw counts
+    uses_celsius_frame = False
+
+    def __init__(self) -> None:
+        # Mask reused across frames; a result's mask is valid until the next update
+        self._mask: Optional[np.ndarray] = None
+        # Status lines only change with these settings, so rebuild them on change
+        self._status_key: Optional[tuple] = None
+        self._status: Tuple[str, ...] = ()
 
     def update(
         self,
         frame_raw: np.ndarray,
-        frame_celsius: np.ndarray,
+        frame_celsius: Optional[np.ndarray],
         state: "ModeState",
         temperature_model: TemperatureModel,
     ) -> ModeResult:
-        stats_c = compute_hotspots(frame_celsius)
-        stats = state.stats_to_display(stats_c)
-        mask = highlight_threshold(frame_celsius, state.threshold_c, state.threshold_mode)
-        status = [
-            f"Highlight {state.threshold_mode}",
-            f"AEL {'ON' if state.auto_exposure_lock else 'OFF'}",
-        ]
+        stats = state.stats_to_display(compute_hotspots_raw(frame_raw, temperature_model))
+        if self._mask is None or self._mask.shape != frame_raw.shape:
+            self._mask = np.empty(frame_raw.shape, dtype=bool)
+        mask = highlight_threshold_raw(
+            frame_raw, temperature_model, state.threshold_c, state.threshold_mode, out=self._mask
+        )
+        key = (state.threshold_mode, state.auto_exposure_lock)
+        if key != self._status_key:
+            self._status_key = key
+            self._status = (
+                f"Highlight {state.threshold_mode}",
+                f"AEL {'ON' if state.auto_exposure_lock else 'OFF'}",
+            )
         return ModeResult(
-            status=status,
+            status=self._status,
             highlight_mask=mask,
             stats=stats,
             highlight_color=state.highlight_color(),
@@ -99,17 +119,18 @@ class LiveHighlightMode(Mode):
 
 class PaletteMode(Mode):
     name = "Palette"
+    uses_celsius_frame = False
+    _STATUS = ("UP/DOWN change palette",)
 
     def update(
         self,
         frame_raw: np.ndarray,
-        frame_celsius: np.ndarray,
+        frame_celsius: Optional[np.ndarray],
         state: "ModeState",
         temperature_model: TemperatureModel,
     ) -> ModeResult:
-        stats = state.stats_to_display(compute_hotspots(frame_celsius))
-        status = ["UP/DOWN change palette"]
-        return ModeResult(status=status, stats=stats)
+        stats = state.stats_to_display(compute_hotspots_raw(frame_raw, temperature_model))
+        return ModeResult(status=self._STATUS, stats=stats)
 
     def on_button_up(self, state: "ModeState") -> Optional[str]:
         state.increment_palette()
@@ -122,6 +143,7 @@ class PaletteMode(Mode):
 
 class FlatFieldCalibrationMode(Mode):
     name = "FFC"
+    uses_celsius_frame = False
 
     def __init__(self, hooks: ModeHooks, frames_to_average: int = 60) -> None:
         self.hooks = hooks
@@ -147,7 +169,7 @@ class FlatFieldCalibrationMode(Mode):
     def update(
         self,
         frame_raw: np.ndarray,
-        frame_celsius: np.ndarray,
+        frame_celsius: Optional[np.ndarray],
         state: "ModeState",
         temperature_model: TemperatureModel,
     ) -> ModeResult:
@@ -156,13 +178,15 @@ class FlatFieldCalibrationMode(Mode):
 
         if self._capturing:
             if self._accumulator is None:
-                self._accumulator = np.zeros_like(frame_raw, dtype=np.float32)
-            self._accumulator += frame_raw.astype(np.float32)
+                # Exact integer sum; uint32 holds 65536 frames of 16-bit counts
+                self._accumulator = np.zeros(frame_raw.shape, dtype=np.uint32)
+            np.add(self._accumulator, frame_raw, out=self._accumulator)
             self._captured += 1
             status.append(f"Capturing frame {self._captured}/{self.frames_to_average}")
 
             if self._captured >= self.frames_to_average:
-                average = (self._accumulator / float(self._captured)).astype(np.uint16)
+                self._accumulator //= self._captured
+                average = self._accumulator.astype(np.uint16)
                 path = self.hooks.save_ffc(average)
                 if path:
                     state.ff_last_saved = path
@@ -202,8 +226,7 @@ class HotColdMode(Mode):
             f"Δ {delta:.1f}°{state.temperature_unit}",
         ]
         # Highlight top and bottom 2% pixels
-        high_thresh = np.percentile(frame_celsius, 98)
-        low_thresh = np.percentile(frame_celsius, 2)
+        low_thresh, high_thresh = histogram_percentiles(frame_celsius, 2, 98)
         mask = np.logical_or(frame_celsius >= high_thresh, frame_celsius <= low_thresh)
         return ModeResult(
             status=status,
@@ -213,7 +236,7 @@ class HotColdMode(Mode):
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SettingItem:
     label: str
     action: Callable[["ModeState"], Optional[str]]
@@ -221,6 +244,7 @@ class SettingItem:
 
 class SettingsMode(Mode):
     name = "Settings"
+    uses_celsius_frame = False
 
     def __init__(self) -> None:
         self.items: List[SettingItem] = [
@@ -229,6 +253,8 @@ class SettingsMode(Mode):
             SettingItem("Cycle Highlight", self._cycle_highlight),
             SettingItem("Reset Threshold", self._reset_threshold),
         ]
+        self._status_index: Optional[int] = None
+        self._status: Tuple[str, ...] = ()
 
     def _toggle_ael(self, state: "ModeState") -> Optional[str]:
         state.auto_exposure_lock = not state.auto_exposure_lock
@@ -249,15 +275,18 @@ class SettingsMode(Mode):
     def update(
         self,
         frame_raw: np.ndarray,
-        frame_celsius: np.ndarray,
+        frame_celsius: Optional[np.ndarray],
         state: "ModeState",
         temperature_model: TemperatureModel,
     ) -> ModeResult:
-        status = ["MODE to activate"]
-        for idx, item in enumerate(self.items):
-            prefix = ">" if idx == state.settings_index else " "
-            status.append(f"{prefix} {item.label}")
-        return ModeResult(status=status)
+        if state.settings_index != self._status_index:
+            self._status_index = state.settings_index
+            status = ["MODE to activate"]
+            for idx, item in enumerate(self.items):
+                prefix = ">" if idx == state.settings_index else " "
+                status.append(f"{prefix} {item.label}")
+            self._status = tuple(status)
+        return ModeResult(status=self._status)
 
     def on_button_up(self, state: "ModeState") -> Optional[str]:
         state.settings_index = (state.settings_index + 1) % len(self.items)
@@ -273,7 +302,7 @@ class SettingsMode(Mode):
         return True, message
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ModeState:
     palette_idx: int = 0
     palette_names: Sequence[str] = dataclasses.field(default_factory=list)
@@ -342,6 +371,9 @@ class ModeState:
         self.temperature_unit = "F" if self.temperature_unit == "C" else "C"
 
     def stats_to_display(self, stats: dict) -> dict:
+        if self.temperature_unit == "C":
+            # Identity conversion: hand back the caller's fresh dict as-is
+            return stats
         converted = {}
         for key, (value, coords) in stats.items():
             converted[key] = (self.convert_c_to_display(value), coords)
@@ -379,6 +411,8 @@ class ModeManager:
             SettingsMode(),
         ]
         self._index = 0
+        # Celsius frame buffer, reused by every update
+        self._frame_c: Optional[np.ndarray] = None
 
     @property
     def current(self) -> Mode:
@@ -402,6 +436,11 @@ class ModeManager:
         return self.current.on_button_down(self.state)
 
     def update(self, frame_raw: np.ndarray) -> ModeResult:
-        frame_c = self.temperature_model.to_celsius(frame_raw)
-        return self.current.update(frame_raw, frame_c, self.state, self.temperature_model)
+        mode = self.current
+        frame_c = None
+        if mode.uses_celsius_frame:
+            if self._frame_c is None or self._frame_c.shape != frame_raw.shape:
+                self._frame_c = np.empty(frame_raw.shape, dtype=np.float32)
+            frame_c = self.temperature_model.to_celsius(frame_raw, out=self._frame_c)
+        return mode.update(frame_raw, frame_c, self.state, self.temperature_model)
 
@@ -4,12 +4,13 @@ Overlay helpers for mode/status notifications.
 
 from __future__ import annotations
 
+import functools
 import time
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class BannerMessage:
     text: str
     expires_at: float
@@ -18,19 +19,26 @@ class BannerMessage:
         return time.time() < self.expires_at
 
 
-@dataclass
+@dataclass(slots=True)
 class BannerQueue:
     default_timeout: float = 2.0
     _messages: List[BannerMessage] = field(default_factory=list, init=False)
+    # Texts of the live messages, rebuilt only when a message is pushed or expires
+    _texts: List[str] = field(default_factory=list, init=False)
+    _next_expiry: float = field(default=float("inf"), init=False)
 
     def push(self, text: str, timeout: float | None = None) -> None:
         expiry = time.time() + (timeout if timeout is not None else self.default_timeout)
         self._messages.append(BannerMessage(text=text, expires_at=expiry))
+        self._next_expiry = 0.0  # force a rebuild on the next query
 
     def active_messages(self) -> List[str]:
         now = time.time()
-        self._messages = [msg for msg in self._messages if msg.expires_at > now]
-        return [msg.text for msg in self._messages]
+        if now >= self._next_expiry:
+            self._messages = [msg for msg in self._messages if msg.expires_at > now]
+            self._texts = [msg.text for msg in self._messages]
+            self._next_expiry = min((msg.expires_at for msg in self._messages), default=float("inf"))
+        return list(self._texts)
 
 
 def format_status(
@@ -39,8 +47,20 @@ def format_status(
     temperature_unit: str,
     threshold: float | None = None,
 ) -> List[str]:
+    return list(_status_lines(mode_name, palette_name, temperature_unit, threshold))
+
+
+@functools.lru_cache(maxsize=64)
+def _status_lines(
+    mode_name: str,
+    palette_name: str,
+    temperature_unit: str,
+    threshold: float | None,
+) -> Tuple[str, ...]:
+    # Status inputs change only on button presses, so the formatted lines
+    # are reused across frames instead of re-running the f-strings.
     parts: List[str] = [f"{mode_name} Mode", f"Palette {palette_name}"]
     if threshold is not None:
         parts.append(f"Target {threshold:.1f}°{temperature_unit}")
-    return parts
+    return tuple(parts)
 
@@ -5,8 +5,10 @@ Frame processing utilities: temperature estimation, colormap conversion, overlay
 from __future__ import annotations
 
 import dataclasses
+import functools
+import math
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 import cv2
 import numpy as np
@@ -57,6 +59,13 @@ else:
     _FONT_MAIN = ImageFont.load_default()
     _FONT_SMALL = _FONT_MAIN
 
+_HIGHLIGHT_KERNEL = np.ones((3, 3), dtype=np.uint8)
+# Element types cv2.minMaxLoc reads directly, without an upcast copy
+_MINMAX_DTYPES = frozenset(
+    np.dtype(t) for t in (np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64)
+)
+
+
 @dataclasses.dataclass
 class TemperatureModel:
     """
@@ -70,58 +79,190 @@ class TemperatureModel:
     scale: float = 0.04  # counts to Kelvin approximation
     offset: float = 273.15
 
-    def to_celsius(self, frame: np.ndarray) -> np.ndarray:
-        return frame.astype(np.float32) * self.scale - self.offset
-
-
-def normalize_to_8bit(frame: np.ndarray, lock: bool = False) -> np.ndarray:
+    def to_celsius(self, frame: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Convert raw counts to Celsius as float32. The uint16->float32 cast is
+        fused into the multiply, and ``out`` lets callers reuse one buffer.
+        """
+        out = np.multiply(frame, self.scale, out=out, dtype=np.float32)
+        out -= self.offset
+        return out
+
+    def celsius_at(self, frame: np.ndarray, points: Sequence[Tuple[int, int]]) -> List[float]:
+        """
+        Convert only the given (x, y) pixels, for readouts that do not need
+        a full float32 temperature field.
+        """
+        return [float(frame[y, x]) * self.scale - self.offset for x, y in points]
+
+
+def normalize_to_8bit(
+    frame: np.ndarray,
+    lock: bool = False,
+    clip_percentile: float = 0.0,
+) -> np.ndarray:
     """
     Normalize a 16-bit frame into 8-bit space suitable for color mapping.
+
+    With a non-zero ``clip_percentile`` the stretch uses the low/high
+    percentiles (e.g. 4 -> 4th/96th) instead of min/max so a few dead or
+    saturated pixels do not flatten the contrast of the whole scene.
     """
     if lock:
         return cv2.convertScaleAbs(frame, alpha=1.0 / 256.0)
 
-    min_val = float(frame.min())
-    max_val = float(frame.max())
+    if clip_percentile <= 0.0:
+        # Min/max scan and scale in OpenCV; a flat frame maps to zeros
+        return cv2.normalize(frame, None, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
+
+    # One partition pass for both bounds
+    low, high = np.percentile(frame, (clip_percentile, 100.0 - clip_percentile))
+    min_val, max_val = float(low), float(high)
     if max_val <= min_val:
         return np.zeros_like(frame, dtype=np.uint8)
+    # Saturating scale clamps the clipped tails to 0/255 without a float copy
+    alpha = 255.0 / (max_val - min_val)
+    return cv2.convertScaleAbs(frame, alpha=alpha, beta=-min_val * alpha)
 
-    normalized = ((frame - min_val) / (max_val - min_val) * 255.0).astype(np.uint8)
-    return normalized
+
+@functools.lru_cache(maxsize=None)
+def _colormap_lut(colormap: int) -> np.ndarray:
+    """
+    256-entry BGR table for an OpenCV colormap, built once per palette.
+    """
+    ramp = np.arange(256, dtype=np.uint8).reshape(256, 1)
+    lut = cv2.applyColorMap(ramp, colormap).reshape(256, 1, 3)
+    lut.flags.writeable = False
+    return lut
 
 
 def apply_colormap(gray8: np.ndarray, colormap: int) -> np.ndarray:
     if colormap == -1:
         return cv2.cvtColor(gray8, cv2.COLOR_GRAY2RGB)
-    return cv2.applyColorMap(gray8, colormap)
+    # applyColorMap rebuilds its table on every call; cv2.LUT on a
+    # three-channel copy of the frame is about 3x faster.
+    return cv2.LUT(cv2.cvtColor(gray8, cv2.COLOR_GRAY2BGR), _colormap_lut(colormap))
 
 
 def compute_hotspots(frame: np.ndarray) -> Dict[str, Tuple[float, Tuple[int, int]]]:
-    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(frame.astype(np.float32))
+    if frame.dtype not in _MINMAX_DTYPES:
+        frame = frame.astype(np.float32)
+    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(frame)
     return {
         "min": (float(min_val), (int(min_loc[0]), int(min_loc[1]))),
         "max": (float(max_val), (int(max_loc[0]), int(max_loc[1]))),
     }
 
 
-def highlight_threshold(frame_c: np.ndarray, target: float, mode: str = ">") -> np.ndarray:
+def compute_hotspots_raw(
+    frame_raw: np.ndarray, model: TemperatureModel
+) -> Dict[str, Tuple[float, Tuple[int, int]]]:
+    """
+    Locate min/max on raw counts and convert just those two pixels to Celsius.
+
+    Equivalent to ``compute_hotspots(model.to_celsius(frame_raw))`` without
+    materializing the float32 frame. A negative scale maps the lowest count
+    to the highest temperature, so the two locations swap.
+    """
+    stats = compute_hotspots(frame_raw)
+    coords = [loc for _, loc in stats.values()]
+    if model.scale < 0:
+        coords.reverse()
+    temps = model.celsius_at(frame_raw, coords)
+    return {key: (temp, loc) for key, temp, loc in zip(stats, temps, coords)}
+
+
+def histogram_percentiles(
+    frame: np.ndarray, low: float, high: float, bins: int = 1024
+) -> Tuple[float, float]:
+    """
+    Approximate the ``low`` and ``high`` percentiles of a float32 frame from
+    one histogram pass instead of np.percentile's partial sorts.
+
+    Each bound is rounded outward to its bin edge (``(max - min) / bins``
+    wide), so thresholding with ``<= low`` / ``>= high`` never misses a
+    pixel beyond the exact percentile.
+    """
+    min_val, max_val, _, _ = cv2.minMaxLoc(frame)
+    if max_val <= min_val:
+        return min_val, max_val
+    step = (max_val - min_val) / bins * (1.0 + 1e-6)  # keep max inside the last bin
+    hist = cv2.calcHist([frame], [0], None, [bins], [min_val, min_val + step * bins])
+    cumulative = np.cumsum(hist.ravel())
+    total = cumulative[-1]
+    low_bin = int(np.searchsorted(cumulative, total * low / 100.0))
+    high_bin = int(np.searchsorted(cumulative, total * high / 100.0))
+    return min_val + (low_bin + 1) * step, min_val + high_bin * step
+
+
+def highlight_threshold(
+    frame_c: np.ndarray,
+    target: float,
+    mode: str = ">",
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """
     Create a boolean mask selecting pixels above/below/near a temperature.
     Mode accepts '>', '<', '='.
+
+    Pass a boolean ``out`` of the frame's shape to reuse it across frames.
+    """
+    if out is None:
+        out = np.empty(frame_c.shape, dtype=bool)
+    if mode == ">":
+        return np.greater(frame_c, target, out=out)
+    if mode == "<":
+        return np.less(frame_c, target, out=out)
+    tolerance = 0.5  # degrees Celsius
+    # Two comparisons instead of a float32 |frame - target| temporary
+    np.greater_equal(frame_c, target - tolerance, out=out)
+    out &= frame_c <= target + tolerance
+    return out
+
+
+def highlight_threshold_raw(
+    frame_raw: np.ndarray,
+    model: TemperatureModel,
+    target: float,
+    mode: str = ">",
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """
+    Same mask as ``highlight_threshold(model.to_celsius(frame_raw), ...)``,
+    computed on the integer counts.
+
+    The Celsius bounds are mapped back to whole counts once per call, so
+    there is no float32 temperature field and the compare runs on uint16.
+    Only a pixel sitting exactly on a bound can land differently, where the
+    float32 path rounds.
+    """
+    if model.scale == 0:
+        # Constant temperature field: no inverse mapping to counts
+        return highlight_threshold(model.to_celsius(frame_raw), target, mode, out=out)
+    if out is None:
+        out = np.empty(frame_raw.shape, dtype=bool)
+
+    def counts(value_c: float) -> float:
+        return (value_c + model.offset) / model.scale
+
+    if model.scale < 0:  # counts fall as temperature rises
+        mode = {">": "<", "<": ">"}.get(mode, mode)
     if mode == ">":
-        return frame_c > target
+        return np.greater(frame_raw, math.floor(counts(target)), out=out)
     if mode == "<":
-        return frame_c < target
+        return np.less(frame_raw, math.ceil(counts(target)), out=out)
     tolerance = 0.5  # degrees Celsius
-    return np.abs(frame_c - target) <= tolerance
+    low, high = sorted((counts(target - tolerance), counts(target + tolerance)))
+    np.greater_equal(frame_raw, math.ceil(low), out=out)
+    out &= frame_raw <= math.floor(high)
+    return out
 
 
 def render_overlay(
     rgb_frame: np.ndarray,
     temperature_frame: np.ndarray,
     stats: Dict[str, Tuple[float, Tuple[int, int]]] | None,
-    status_lines: List[str],
+    status_lines: Sequence[str],
     temperature_unit: str,
     highlight_mask: np.ndarray | None = None,
     highlight_color: Tuple[int, int, int] | None = None,
@@ -132,37 +273,22 @@ def render_overlay(
     The incoming rgb_frame must be shape (H, W, 3) in BGR order. This function
     converts to RGB before creating the PIL image.
     """
+    # Blends run in place on the converted array; PIL is only used for text
     rgb = cv2.cvtColor(rgb_frame, cv2.COLOR_BGR2RGB)
-    image = Image.fromarray(rgb)
-    draw = ImageDraw.Draw(image)
-
-    width, height = image.size
-
-    if highlight_mask is not None:
-        overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-        points = np.argwhere(highlight_mask)
-        if points.size:
-            color = highlight_color or (255, 255, 0)
-            # Sample more aggressively to avoid stripes and overdrawing
-            # Use fewer points for smoother highlight
-            step = max(1, len(points) // 800)  # Reduced from 1500 to 800 for better coverage
-            # Use smaller highlight dots
-            for y, x in points[::step]:
-                x0, y0 = max(0, int(x) - 1), max(0, int(y) - 1)
-                x1, y1 = min(width, int(x) + 1), min(height, int(y) + 1)
-                overlay_draw.rectangle(
-                    (x0, y0, x1, y1),
-                    fill=(color[0], color[1], color[2], 120),  # Reduced opacity from 160 to 120
-                )
-        image = Image.alpha_composite(image.convert("RGBA"), overlay).convert("RGB")
-        draw = ImageDraw.Draw(image)
-
-    if stats:
-        for label, (value, (x, y)) in stats.items():
-            text = f"{label.upper()} {value:.1f}°{temperature_unit}"
-            draw.text((x, y), text, fill=(255, 255, 255), font=_FONT_SMALL)
-
+    height, width = rgb.shape[:2]
+
+    if highlight_mask is not None and highlight_mask.any():
+        color = highlight_color or (255, 255, 0)
+        # Grow every highlighted pixel into a 3x3 dot in one vectorized pass
+        dots = cv2.dilate(highlight_mask.astype(np.uint8), _HIGHLIGHT_KERNEL)
+        # Blend the whole frame in one SIMD pass and copy back only the dots;
+        # far cheaper than a boolean gather/scatter, and rounds like _blend
+        tint = np.empty_like(rgb)
+        tint[...] = color
+        blended = cv2.addWeighted(rgb, (255 - 120) / 255.0, tint, 120 / 255.0, 0.0)
+        cv2.copyTo(blended, dots, rgb)
+
+    status_layout = None
     if status_lines:
         # Use smaller font and padding for compact overlay
         padding = 3
@@ -172,7 +298,7 @@ def render_overlay(
         # Use small font for status text
         status_font = _FONT_SMALL
         for line in status_lines:
-            bbox = draw.textbbox((0, 0), line, font=status_font)
+            bbox = status_font.getbbox(line)
             width_line = bbox[2] - bbox[0]
             height_line = bbox[3] - bbox[1]
             line_metrics.append((line, width_line, height_line))
@@ -182,16 +308,91 @@ def render_overlay(
         x0 = width - max_width - padding * 2
         y0 = height - total_height - padding * 2
         # Semi-transparent black background for text overlay
-        overlay_bg = Image.new("RGBA", image.size, (0, 0, 0, 0))  # Start with transparent
-        overlay_draw = ImageDraw.Draw(overlay_bg)
-        overlay_draw.rectangle((x0, y0, width, height), fill=(0, 0, 0, 200))  # Semi-transparent black
-        image = Image.alpha_composite(image.convert("RGBA"), overlay_bg).convert("RGB")
-        draw = ImageDraw.Draw(image)
+        box = rgb[max(0, y0):, max(0, x0):]
+        box[...] = _blend(box, 0, 200)
+        status_layout = (line_metrics, max_width, padding, line_spacing, y0)
 
+    if stats:
+        for label, (value, (x, y)) in stats.items():
+            text = f"{label.upper()} {value:.1f}°{temperature_unit}"
+            _draw_text(rgb, (x, y), text, _FONT_SMALL)
+
+    if status_layout is not None:
+        line_metrics, max_width, padding, line_spacing, y0 = status_layout
         cursor_y = y0 + padding
         for line, line_w, line_h in line_metrics:
-            draw.text((width - max_width - padding, cursor_y), line, fill=(255, 255, 255), font=status_font)
+            _draw_text(rgb, (width - max_width - padding, cursor_y), line, _FONT_SMALL)
             cursor_y += line_h + line_spacing
 
-    return image
+    return Image.fromarray(rgb)
+
+
+def _blend(dst: np.ndarray, color, alpha) -> np.ndarray:
+    """
+    Composite ``color`` over uint8 ``dst`` at ``alpha``/255 (a scalar or a
+    per-pixel uint8 array), rounding like PIL.
+    """
+    mixed = dst.astype(np.uint16) * (255 - alpha)
+    mixed += np.asarray(color, dtype=np.uint16) * alpha + 127
+    mixed //= 255
+    return mixed.astype(np.uint8)
+
 
+@functools.lru_cache(maxsize=512)
+def _glyph_mask(char: str, font: ImageFont.ImageFont) -> Tuple[np.ndarray | None, int, int, float]:
+    """
+    Rasterize one character. Returns its coverage mask (None for blank
+    glyphs such as spaces), the mask offset and the pen advance.
+    """
+    advance = font.getlength(char)
+    left, top, right, bottom = font.getbbox(char)
+    if right <= left or bottom <= top:
+        return None, 0, 0, advance
+    tile = Image.new("L", (right - left, bottom - top))
+    ImageDraw.Draw(tile).text((-left, -top), char, fill=255, font=font)
+    mask = np.asarray(tile)
+    if not mask.any():
+        return None, 0, 0, advance
+    return mask, left, top, advance
+
+
+@functools.lru_cache(maxsize=64)
+def _text_mask(text: str, font: ImageFont.ImageFont) -> Tuple[np.ndarray, int, int]:
+    """
+    Coverage mask for ``text`` and its offset from the draw origin.
+
+    Strings are assembled from cached glyphs, so FreeType only runs the
+    first time a character is seen; readouts like "MAX 31.2°C" change
+    every frame but reuse the same dozen glyphs. Whole strings are cached
+    on top for the labels that repeat.
+    """
+    pen = 0.0
+    placed = []
+    for char in text:
+        mask, left, top, advance = _glyph_mask(char, font)
+        if mask is not None:
+            placed.append((mask, int(round(pen)) + left, top))
+        pen += advance
+    if not placed:
+        return np.zeros((1, 1), dtype=np.uint8), 0, 0
+    x0 = min(x for _, x, _ in placed)
+    y0 = min(y for _, _, y in placed)
+    x1 = max(x + mask.shape[1] for mask, x, _ in placed)
+    y1 = max(y + mask.shape[0] for mask, _, y in placed)
+    tile = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+    for mask, x, y in placed:
+        region = tile[y - y0:y - y0 + mask.shape[0], x - x0:x - x0 + mask.shape[1]]
+        np.maximum(region, mask, out=region)
+    return tile, x0, y0
+
+
+def _draw_text(rgb: np.ndarray, origin: Tuple[int, int], text: str, font: ImageFont.ImageFont) -> None:
+    """Blend white ``text`` onto ``rgb`` in place, clipped to the frame."""
+    mask, left, top = _text_mask(text, font)
+    x0, y0 = int(origin[0]) + left, int(origin[1]) + top
+    mask = mask[max(0, -y0):rgb.shape[0] - y0, max(0, -x0):rgb.shape[1] - x0]
+    if mask.size == 0:
+        return
+    x0, y0 = max(0, x0), max(0, y0)
+    region = rgb[y0:y0 + mask.shape[0], x0:x0 + mask.shape[1]]
+    region[...] = _blend(region, 255, mask[..., None])
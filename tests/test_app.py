@@ -0,0 +1,182 @@
+import asyncio
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from pi_app.app.app import AppOptions, ThermalApp, parse_args
+from pi_app.app.display import rgb888_to_rgb565
+
+
+def make_app(**overrides):
+    options = AppOptions(use_synthetic=True, lcd="null", **overrides)
+    return ThermalApp(options)
+
+
+def test_colormap_lut_matches_opencv():
+    app = make_app(colormap="hot")
+    gray = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    expected = cv2.cvtColor(cv2.applyColorMap(gray, 12), cv2.COLOR_BGR2RGB)
+    result = app._apply_colormap(gray)
+    assert result.shape == (16, 16)
+    assert np.array_equal(result, rgb888_to_rgb565(expected))
+    app.shutdown()
+
+
+def test_apply_colormap_writes_into_buffer():
+    app = make_app(colormap="0")
+    gray = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    out = np.empty((3, 4), dtype=">u2")
+    result = app._apply_colormap(gray, out=out)
+    assert result is out
+    assert np.array_equal(out, rgb888_to_rgb565(np.stack([gray, gray, gray], axis=-1)))
+    app.shutdown()
+
+
+def test_normalize_to_gray_saturates():
+    app = make_app()
+    frame = np.linspace(1000, 5000, app._gray8.size).astype(np.uint16).reshape(app._gray8.shape)
+    alpha = 255.0 / 2000.0
+    gray = app._normalize_to_gray(frame, alpha, -1000.0 * alpha)
+    assert gray is app._gray8
+    assert gray.min() == 0
+    assert gray.max() == 255
+    assert np.count_nonzero(gray == 255) > gray.size // 3  # upper half saturates
+    app.shutdown()
+
+
+def test_unknown_colormap_falls_back_to_grayscale():
+    app = make_app(colormap="not-a-palette")
+    gray_app = make_app()
+    try:
+        gray = np.arange(256, dtype=np.uint8)
+        assert np.array_equal(app._apply_colormap(gray), gray_app._apply_colormap(gray))
+    finally:
+        app.shutdown()
+        gray_app.shutdown()
+
+
+def test_min_max_single_pass():
+    app = make_app()
+    frame = np.full((4, 6), 500, dtype=np.uint16)
+    frame[1, 2] = 12
+    frame[3, 5] = 60000
+    assert app._min_max(frame) == (12.0, 60000.0)
+    app.shutdown()
+
+
+def test_resize_fallback_matches_nearest(monkeypatch):
+    app = make_app()
+    gray = np.arange(app._gray8.size, dtype=np.uint32).reshape(app._gray8.shape).astype(np.uint8)
+    monkeypatch.setattr("pi_app.app.app.cv2", None)
+    out = np.empty_like(app._gray_lcd)
+    result = app._resize_for_display(gray, out=out)
+    assert result is out
+    assert np.array_equal(out[0], gray[0, app._resize_cols])
+    assert np.array_equal(out[:, 0], gray[app._resize_rows, 0])
+    app.shutdown()
+
+
+def test_apply_colormap_opencv_matches_numpy(monkeypatch):
+    app = make_app(colormap="jet")
+    gray = np.random.default_rng(1).integers(0, 256, (20, 30), dtype=np.uint8)
+    out = np.empty((20, 30), dtype=">u2")
+    assert app._apply_colormap(gray, out=out) is out
+    monkeypatch.setattr("pi_app.app.app.cv2", None)
+    assert np.array_equal(out, app._apply_colormap(gray))
+    app.shutdown()
+
+
+def test_normalize_fallback_matches_opencv(monkeypatch):
+    app = make_app()
+    frame = np.random.default_rng(2).integers(3000, 9000, app._gray8.shape).astype(np.uint16)
+    alpha = 255.0 / 6000.0
+    expected = app._normalize_to_gray(frame, alpha, -3000.0 * alpha).copy()
+    monkeypatch.setattr("pi_app.app.app.cv2", None)
+    result = app._normalize_to_gray(frame, alpha, -3000.0 * alpha).astype(np.int16)
+    # Both round to nearest; only float32 ties at .5 may land differently
+    assert np.abs(result - expected).max() <= 1
+    assert np.count_nonzero(result != expected) < expected.size // 100
+    app.shutdown()
+
+
+def test_frame_deadlines_reset_after_falling_behind(monkeypatch):
+    app = make_app()
+    monkeypatch.setattr("pi_app.app.app.time.monotonic", lambda: 100.0)
+    # On schedule: the next deadline is one period later
+    assert asyncio.run(app._wait_for_next_frame(100.0, 0.1)) == pytest.approx(100.1)
+    # Far behind: restart from now rather than catching up
+    assert asyncio.run(app._wait_for_next_frame(99.0, 0.1)) == pytest.approx(100.1)
+    app.shutdown()
+
+
+def test_source_view_folds_flip_and_rotation():
+    frame = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    cases = {
+        (0, False): frame,
+        (0, True): frame[:, ::-1],
+        (2, False): frame[::-1, ::-1],
+        (2, True): frame[::-1, :],
+    }
+    for (rotate, flip), expected in cases.items():
+        app = make_app(display_rotate=rotate, display_flip_horizontal=flip)
+        assert np.array_equal(frame[app._source_view], expected)
+        app.shutdown()
+
+
+def test_fps_flag_rejects_non_positive(monkeypatch):
+    for value in ("0", "-5", "nan"):
+        monkeypatch.setattr("sys.argv", ["app", "--fps", value])
+        with pytest.raises(SystemExit):
+            parse_args()
+    monkeypatch.setattr("sys.argv", ["app", "--fps", "12.5"])
+    assert parse_args().fps == 12.5
+
+
+def test_shutdown_keeps_camera_open_while_reader_busy(monkeypatch):
+    app = make_app()
+    release = threading.Event()
+    app._reader = threading.Thread(target=release.wait, daemon=True)
+    app._reader.start()
+    closed = []
+    monkeypatch.setattr(app.camera, "close", lambda: closed.append(True))
+    join = app._reader.join
+    monkeypatch.setattr(app._reader, "join", lambda timeout=None: join(0.01))
+    app.shutdown()
+    assert closed == []
+    release.set()
+    join()
+    app.shutdown()
+    assert closed == [True]
+
+
+def test_shutdown_keeps_display_open_while_writer_busy(monkeypatch):
+    app = make_app()
+    release = threading.Event()
+    app._display_thread = threading.Thread(target=release.wait, daemon=True)
+    app._display_thread.start()
+    cleaned = []
+    monkeypatch.setattr(app.display, "cleanup", lambda: cleaned.append(True))
+    join = app._display_thread.join
+    monkeypatch.setattr(app._display_thread, "join", lambda timeout=None: join(0.01))
+    app.shutdown()
+    assert cleaned == []
+    release.set()
+    join()
+    app.shutdown()
+    assert cleaned == [True]
+
+
+def test_normalize_to_gray_applies_orientation(monkeypatch):
+    for rotate, flip in ((0, True), (2, False), (2, True)):
+        app = make_app(display_rotate=rotate, display_flip_horizontal=flip)
+        frame = np.random.default_rng(6).integers(0, 256, app._gray8.shape).astype(np.uint16)
+        expected = frame[app._source_view].astype(np.uint8)
+        result = app._normalize_to_gray(frame, 1.0, 0.0)
+        assert result is app._gray8
+        assert np.array_equal(result, expected)
+        monkeypatch.setattr("pi_app.app.app.cv2", None)
+        assert np.array_equal(app._normalize_to_gray(frame, 1.0, 0.0), expected)
+        monkeypatch.setattr("pi_app.app.app.cv2", cv2)
+        app.shutdown()
@@ -1,3 +1,8 @@
+import json
+import os
+
+import pytest
+
 from pi_app.app.config import ConfigData, load_config, save_config
 
 
@@ -21,3 +26,57 @@ def test_config_roundtrip(tmp_path, monkeypatch):
 
     assert loaded == data
 
+
+def test_save_config_replaces_atomically(tmp_path, monkeypatch):
+    monkeypatch.setattr("pi_app.app.config.CONFIG_DIR", tmp_path)
+    monkeypatch.setattr("pi_app.app.config.CONFIG_PATH", tmp_path / "config.json")
+
+    save_config(ConfigData(palette_index=1))
+    save_config(ConfigData(palette_index=7))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+    assert load_config().palette_index == 7
+
+
+def test_save_config_failure_keeps_old_file(tmp_path, monkeypatch):
+    monkeypatch.setattr("pi_app.app.config.CONFIG_DIR", tmp_path)
+    monkeypatch.setattr("pi_app.app.config.CONFIG_PATH", tmp_path / "config.json")
+
+    save_config(ConfigData(palette_index=3))
+    before = (tmp_path / "config.json").read_text(encoding="utf-8")
+
+    def broken_dump(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", broken_dump)
+    with pytest.raises(OSError):
+        save_config(ConfigData(palette_index=8))
+
+    assert (tmp_path / "config.json").read_text(encoding="utf-8") == before
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_save_config_keeps_file_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr("pi_app.app.config.CONFIG_DIR", tmp_path)
+    monkeypatch.setattr("pi_app.app.config.CONFIG_PATH", tmp_path / "config.json")
+
+    monkeypatch.setattr("pi_app.app.config._NEW_FILE_MODE", 0o644)
+    save_config(ConfigData())
+    assert (tmp_path / "config.json").stat().st_mode & 0o777 == 0o644
+
+    os.chmod(tmp_path / "config.json", 0o640)
+    save_config(ConfigData(palette_index=6))
+    assert (tmp_path / "config.json").stat().st_mode & 0o777 == 0o640
+
+
+def test_load_config_fills_missing_fields(tmp_path, monkeypatch):
+    monkeypatch.setattr("pi_app.app.config.CONFIG_DIR", tmp_path)
+    monkeypatch.setattr("pi_app.app.config.CONFIG_PATH", tmp_path / "config.json")
+
+    (tmp_path / "config.json").write_text('{"palette_index": 4}', encoding="utf-8")
+    first = load_config()
+    first.threshold_c = 99.0
+    second = load_config()
+
+    assert first.palette_index == second.palette_index == 4
+    assert second.threshold_c == ConfigData().threshold_c
@@ -0,0 +1,69 @@
+import numpy as np
+
+from pi_app.app.display import Waveshare24Display, rgb565_to_rgb888, rgb888_to_rgb565
+
+
+def test_rgb565_packing_matches_st7789_layout():
+    frame = np.array([[[255, 0, 0], [0, 255, 0], [0, 0, 255], [255, 255, 255]]], dtype=np.uint8)
+    packed = rgb888_to_rgb565(frame)
+    assert packed.dtype == np.dtype(">u2")
+    assert packed.tolist() == [[0xF800, 0x07E0, 0x001F, 0xFFFF]]
+    # High byte goes out first on the wire
+    assert packed.tobytes()[:2] == b"\xf8\x00"
+
+
+def test_rgb565_round_trip_keeps_high_bits():
+    frame = np.random.default_rng(0).integers(0, 256, (4, 5, 3), dtype=np.uint8)
+    restored = rgb565_to_rgb888(rgb888_to_rgb565(frame))
+    assert np.array_equal(restored, frame & np.array([0xF8, 0xFC, 0xF8], dtype=np.uint8))
+
+
+class FakeST7789:
+    def __init__(self):
+        self.calls = []
+        self.SPI = self
+
+    def command(self, cmd):
+        self.calls.append(("command", cmd))
+
+    def data(self, value):
+        self.calls.append(("data", value))
+
+    def SetWindows(self, *window):
+        self.calls.append(("window", window))
+
+    def digital_write(self, pin, value):
+        pass
+
+    def writebytes2(self, buf):
+        self.calls.append(("pixels", len(bytes(buf))))
+
+
+def make_waveshare(width=4, height=3):
+    display = Waveshare24Display.__new__(Waveshare24Display)
+    display.width, display.height, display.rotate = width, height, 0
+    display._use_waveshare = True
+    display._device = FakeST7789()
+    display._dc_pin = 25
+    display._window = None
+    display._last_sent = None
+    display._debug = False
+    display._frame_count = 0
+    return display
+
+
+def test_show_array_sends_only_changed_region():
+    display = make_waveshare()
+    frame = np.zeros((3, 4), dtype=">u2")
+    display.show_array(frame)
+    assert display._device.calls[-2:] == [("window", (0, 0, 4, 3)), ("pixels", 24)]
+
+    display._device.calls.clear()
+    display.show_array(frame)
+    assert display._device.calls == []  # unchanged frame: nothing sent
+
+    frame = frame.copy()
+    frame[1, 2] = 0xFFFF
+    frame[2, 3] = 0x1234
+    display.show_array(frame)
+    assert display._device.calls == [("window", (2, 1, 4, 3)), ("pixels", 8)]
@@ -16,11 +16,16 @@ def make_state():
     return ModeState(palette_names=["GRAY", "HOT"])
 
 
+def make_frame(value, shape=(2, 2)):
+    # Read-only like camera frames, so any in-place write in update() raises
+    return np.broadcast_to(np.uint16(value), shape)
+
+
 def test_live_mode_threshold_updates():
     state = make_state()
     mode = LiveHighlightMode()
     model = TemperatureModel()
-    frame = np.full((4, 4), 2000, dtype=np.uint16)
+    frame = make_frame(2000, (4, 4))
     result = mode.update(frame, model.to_celsius(frame), state, model)
     assert isinstance(result, ModeResult)
     assert result.highlight_color == state.highlight_color()
@@ -36,7 +41,7 @@ def test_palette_mode_cycles():
     state = make_state()
     mode = PaletteMode()
     model = TemperatureModel()
-    frame = np.zeros((2, 2), dtype=np.uint16)
+    frame = make_frame(0)
     mode.update(frame, model.to_celsius(frame), state, model)
 
     name_before = state.palette_name
@@ -63,8 +68,8 @@ def test_flat_field_capture(tmp_path):
 
     mode.on_enter(state)
     mode.on_button_up(state)
-    frame1 = np.ones((2, 2), dtype=np.uint16)
-    frame2 = np.full((2, 2), 3, dtype=np.uint16)
+    frame1 = make_frame(1)
+    frame2 = make_frame(3)
 
     mode.update(frame1, model.to_celsius(frame1), state, model)
     result = mode.update(frame2, model.to_celsius(frame2), state, model)
@@ -80,7 +85,7 @@ def test_settings_mode_menu():
     state = make_state()
     mode = SettingsMode()
     model = TemperatureModel()
-    frame = np.zeros((2, 2), dtype=np.uint16)
+    frame = make_frame(0)
 
     mode.update(frame, model.to_celsius(frame), state, model)
     mode.on_button_up(state)
@@ -115,3 +120,22 @@ def test_live_mode_threshold_units():
     expected_c = prev_c + (1.0 - 0.0) * 5.0 / 9.0
     assert abs(state.threshold_c - expected_c) < 1e-6
 
+
+def test_stats_to_display_converts_only_fahrenheit():
+    state = make_state()
+    stats = {"max": (100.0, (1, 2))}
+    assert state.stats_to_display(stats) is stats
+    state.toggle_temperature_unit()
+    assert state.stats_to_display(stats) == {"max": (212.0, (1, 2))}
+
+
+def test_live_mode_status_rebuilt_on_setting_change():
+    state = make_state()
+    mode = LiveHighlightMode()
+    model = TemperatureModel()
+    frame = make_frame(2000, (4, 4))
+    first = mode.update(frame, model.to_celsius(frame), state, model).status
+    assert mode.update(frame, model.to_celsius(frame), state, model).status is first
+    state.auto_exposure_lock = True
+    status = mode.update(frame, model.to_celsius(frame), state, model).status
+    assert status == ("Highlight >", "AEL ON")
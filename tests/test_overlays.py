@@ -0,0 +1,27 @@
+from pi_app.app import overlays
+from pi_app.app.overlays import BannerQueue, format_status
+
+
+def test_banner_queue_expires_messages(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(overlays.time, "time", lambda: now[0])
+    queue = BannerQueue(default_timeout=2.0)
+    queue.push("Palette JET")
+    queue.push("AEL ON", timeout=5.0)
+    assert queue.active_messages() == ["Palette JET", "AEL ON"]
+
+    now[0] = 103.0
+    assert queue.active_messages() == ["AEL ON"]
+    queue.push("Units °F")
+    assert queue.active_messages() == ["AEL ON", "Units °F"]
+
+    now[0] = 110.0
+    assert queue.active_messages() == []
+
+
+def test_format_status_returns_fresh_lists():
+    lines = format_status("Live", "JET", "C", 30.0)
+    assert lines == ["Live Mode", "Palette JET", "Target 30.0°C"]
+    lines.append("extra")
+    assert format_status("Live", "JET", "C", 30.0) == ["Live Mode", "Palette JET", "Target 30.0°C"]
+    assert format_status("Palette", "HOT", "F") == ["Palette Mode", "Palette HOT"]
@@ -0,0 +1,159 @@
+import cv2
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from pi_app.app import processing
+from pi_app.app.processing import (
+    COLORMAPS,
+    TemperatureModel,
+    apply_colormap,
+    compute_hotspots,
+    compute_hotspots_raw,
+    highlight_threshold,
+    highlight_threshold_raw,
+    histogram_percentiles,
+    normalize_to_8bit,
+    render_overlay,
+)
+
+
+def test_normalize_stretches_full_range():
+    frame = np.array([[1000, 2000], [3000, 4000]], dtype=np.uint16)
+    result = normalize_to_8bit(frame)
+    assert result.dtype == np.uint8
+    assert result.min() == 0
+    assert result.max() == 255
+
+
+def test_normalize_percentile_ignores_outliers():
+    frame = np.tile(np.arange(100, dtype=np.uint16) + 1000, (10, 1))
+    frame[0, 0] = 60000  # single hot pixel
+    plain = normalize_to_8bit(frame)
+    clipped = normalize_to_8bit(frame, clip_percentile=4.0)
+    assert clipped[0, 0] == 255
+    # Contrast of the scene body survives the outlier when clipping
+    assert np.ptp(clipped[1:]) > 200
+    assert np.ptp(plain[1:]) < 5
+
+
+def test_apply_colormap_matches_opencv():
+    gray = np.random.default_rng(3).integers(0, 256, (12, 17), dtype=np.uint8)
+    for _, colormap in COLORMAPS[1:]:
+        assert np.array_equal(apply_colormap(gray, colormap), cv2.applyColorMap(gray, colormap))
+
+
+def test_hotspots_raw_matches_full_conversion():
+    model = TemperatureModel()
+    frame = np.arange(7000, 7012, dtype=np.uint16).reshape(3, 4)
+    expected = compute_hotspots(model.to_celsius(frame))
+    result = compute_hotspots_raw(frame, model)
+    for key in ("min", "max"):
+        assert result[key][1] == expected[key][1]
+        assert abs(result[key][0] - expected[key][0]) < 1e-3
+
+
+def test_highlight_threshold_modes_reuse_buffer():
+    frame_c = np.array([[29.0, 29.6, 30.0], [30.4, 30.6, 31.0]], dtype=np.float32)
+    out = np.empty(frame_c.shape, dtype=bool)
+    assert highlight_threshold(frame_c, 30.0, ">", out=out) is out
+    assert out.tolist() == [[False, False, False], [True, True, True]]
+    assert highlight_threshold(frame_c, 30.0, "<").tolist() == [[True, True, False], [False, False, False]]
+    assert highlight_threshold(frame_c, 30.0, "=", out=out).tolist() == [[False, True, True], [True, False, False]]
+
+
+def test_render_overlay_highlights_3x3_dots():
+    bgr = np.zeros((8, 10, 3), dtype=np.uint8)
+    mask = np.zeros((8, 10), dtype=bool)
+    mask[4, 5] = True
+    image = np.asarray(render_overlay(bgr, None, None, [], "C", mask, (255, 0, 0)))
+    assert (image[3:6, 4:7, 0] > 0).all()
+    assert image[3:6, 4:7, 1:].max() == 0
+    assert image[:, :4].max() == 0 and image[:3].max() == 0
+
+
+def test_render_overlay_reuses_rasterized_text():
+    bgr = np.zeros((60, 80, 3), dtype=np.uint8)
+    stats = {"max": (35.2, (70, 55))}  # label runs off the bottom-right edge
+    first = np.asarray(render_overlay(bgr, None, stats, ["Live Mode"], "C"))
+    hits = processing._text_mask.cache_info().hits
+    second = np.asarray(render_overlay(bgr, None, stats, ["Live Mode"], "C"))
+    assert processing._text_mask.cache_info().hits == hits + 2
+    assert np.array_equal(first, second)
+    assert first.max() == 255  # white text was drawn
+
+
+def test_text_mask_from_glyphs_matches_freetype():
+    font = processing._FONT_SMALL
+    text = "MIN -4.5°F"
+    left, top, right, bottom = font.getbbox(text)
+    tile = Image.new("L", (right - left, bottom - top))
+    ImageDraw.Draw(tile).text((-left, -top), text, fill=255, font=font)
+    mask, x0, y0 = processing._text_mask(text, font)
+    assert (x0, y0) == (left, top)
+    assert mask.shape == tile.size[::-1]
+    # Glyphs sit on whole pixels, so antialiased edges may differ slightly
+    assert np.abs(mask.astype(np.int16) - np.asarray(tile)).max() <= 32
+
+
+def test_to_celsius_writes_into_buffer():
+    model = TemperatureModel()
+    frame = np.array([[7000, 7500]], dtype=np.uint16)
+    out = np.empty(frame.shape, dtype=np.float32)
+    assert model.to_celsius(frame, out=out) is out
+    expected = frame.astype(np.float32) * model.scale - model.offset
+    assert np.allclose(out, expected)
+
+
+def test_histogram_percentiles_bound_exact_percentiles():
+    frame = np.random.default_rng(3).normal(30.0, 5.0, (156, 206)).astype(np.float32)
+    low, high = histogram_percentiles(frame, 2, 98)
+    exact_low, exact_high = np.percentile(frame, (2, 98))
+    bin_width = (frame.max() - frame.min()) / 1024
+    assert exact_low <= low <= exact_low + 2 * bin_width
+    assert exact_high - 2 * bin_width <= high <= exact_high
+    flat = np.full((4, 4), 21.5, dtype=np.float32)
+    assert histogram_percentiles(flat, 2, 98) == (21.5, 21.5)
+
+
+def test_normalize_flat_frame_is_zero():
+    frame = np.full((3, 5), 4321, dtype=np.uint16)
+    for clip in (0.0, 4.0):
+        result = normalize_to_8bit(frame, clip_percentile=clip)
+        assert result.dtype == np.uint8
+        assert not result.any()
+
+
+def test_render_overlay_highlight_matches_blend():
+    rng = np.random.default_rng(4)
+    bgr = rng.integers(0, 256, (30, 40, 3), dtype=np.uint8)
+    mask = rng.random((30, 40)) < 0.05
+    image = np.asarray(render_overlay(bgr, None, None, [], "C", mask, (0, 136, 255)))
+    rgb = bgr[..., ::-1]
+    dots = cv2.dilate(mask.astype(np.uint8), np.ones((3, 3), np.uint8)).view(bool)
+    expected = processing._blend(rgb[dots], np.array((0, 136, 255), dtype=np.uint16), 120)
+    assert np.array_equal(image[dots], expected)
+    assert np.array_equal(image[~dots], rgb[~dots])
+
+
+def test_highlight_threshold_raw_matches_celsius_mask():
+    frame = np.random.default_rng(5).integers(7400, 7800, (20, 30)).astype(np.uint16)
+    for model in (TemperatureModel(), TemperatureModel(scale=-0.04, offset=-330.013)):
+        celsius = model.to_celsius(frame)
+        for mode in (">", "<", "="):
+            expected = highlight_threshold(celsius, 30.1, mode)
+            assert expected.any() and not expected.all()
+            assert np.array_equal(highlight_threshold_raw(frame, model, 30.1, mode), expected)
+        stats = compute_hotspots_raw(frame, model)
+        expected_stats = compute_hotspots(celsius)
+        assert stats["min"][0] < stats["max"][0]
+        for key in ("min", "max"):
+            assert stats[key][0] == pytest.approx(expected_stats[key][0], abs=1e-3)
+            assert frame[stats[key][1][::-1]] == frame[expected_stats[key][1][::-1]]
+
+
+def test_highlight_threshold_raw_zero_scale():
+    frame = np.full((3, 4), 7000, dtype=np.uint16)
+    model = TemperatureModel(scale=0.0, offset=-25.0)  # constant 25 C
+    assert highlight_threshold_raw(frame, model, 20.0, ">").all()
+    assert not highlight_threshold_raw(frame, model, 20.0, "<").any()